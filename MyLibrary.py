@@ -1,6 +1,7 @@
 # MyLibrary.py - 优化版
 
-import sys, time, random, math, pygame
+import sys, os, time, random, math, threading, pygame
+from collections import deque, namedtuple
 from pygame.locals import *
 
 
@@ -148,3 +149,183 @@ class Point(object):
 
     def __str__(self):
         return "{{X:{:.0f},Y:{:.0f}}}".format(self.__x, self.__y)
+
+
+# 绘制指令：surface 为只读图像，pos 为左上角坐标，
+# alpha 为 None 时不修改透明度，flags 为 blit 的 special_flags
+DrawItem = namedtuple("DrawItem", "surface pos alpha flags")
+
+
+def draw_item(surface, pos, alpha=None, flags=0):
+    """构造一条绘制指令"""
+    return DrawItem(surface, (pos[0], pos[1]), alpha, flags)
+
+
+def render_draw_list(screen, draw_list):
+    """
+    按顺序执行绘制列表
+
+    Args:
+        screen: 目标 Surface
+        draw_list: DrawItem 序列
+    """
+    for item in draw_list:
+        if item.alpha is not None:
+            item.surface.set_alpha(item.alpha)
+        screen.blit(item.surface, item.pos, special_flags=item.flags)
+
+
+class RenderThread(object):
+    """
+    独立渲染线程，消费模拟线程提交的绘制列表
+
+    采用双缓冲：模拟线程把最新的列表写入待渲染槽位后立即返回，
+    渲染线程取走后在自己的槽位上执行 blit 和 display.update，
+    双方只在交换槽位时短暂持锁。若渲染跟不上，旧列表被新列表覆盖
+    并计为丢帧。
+
+    统计两侧的墙钟时间与线程 CPU 时间。收益 = 串行执行所需的 CPU 时间
+    （模拟 + 渲染）减去两侧实际占用的墙钟时间（区间并集），
+    因此单核分时或 GIL 争用不会被算作收益。
+
+    渲染线程出错时会退出，异常在主线程下一次 submit/wait_idle 时抛出。
+    SDL 只保证主线程可以更新窗口，仅在 Windows 上启用。
+    """
+
+    def __init__(self, screen, report_interval=300):
+        self.screen = screen
+        self.report_interval = report_interval
+        self._cond = threading.Condition()
+        self._pending = None
+        self._busy_since = None
+        self._recent = deque(maxlen=4)
+        self._running = False
+        self._thread = None
+        self._error = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """清空统计数据，每关开始时调用"""
+        with self._cond:
+            self._recent.clear()
+            self.frames = 0
+            self.submitted = 0
+            self.dropped = 0
+            self.sim_time = 0.0
+            self.sim_cpu = 0.0
+            self.render_time = 0.0
+            self.render_cpu = 0.0
+            self.overlap_time = 0.0
+
+    def start(self):
+        """启动渲染线程"""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="RenderThread", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止渲染线程并输出最终统计"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.submitted:
+            print(self.report())
+
+    def submit(self, draw_list, sim_start, sim_end, sim_cpu):
+        """
+        提交一帧绘制列表（不阻塞）
+
+        Args:
+            draw_list: DrawItem 元组
+            sim_start: 本帧模拟开始时间（perf_counter 秒）
+            sim_end: 本帧模拟结束时间
+            sim_cpu: 本帧模拟线程消耗的 CPU 时间（thread_time 秒）
+        """
+        line = None
+        with self._cond:
+            self._check_error()
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = draw_list
+            self.submitted += 1
+            self.sim_time += sim_end - sim_start
+            self.sim_cpu += sim_cpu
+            self.overlap_time += self._overlap(sim_start, sim_end)
+            self._cond.notify_all()
+            if self.report_interval and self.submitted % self.report_interval == 0:
+                line = self.report()
+        if line is not None:
+            print(line)
+
+    def wait_idle(self):
+        """等待已提交的列表全部渲染完毕，主线程直接绘制前调用"""
+        with self._cond:
+            while self._running and (self._pending is not None or self._busy_since is not None):
+                self._cond.wait()
+            self._check_error()
+
+    def report(self):
+        """返回每帧平均耗时（墙钟/CPU）与并行收益的统计文本"""
+        with self._cond:
+            n = max(self.submitted, 1)
+            m = max(self.frames, 1)
+            serial = self.sim_cpu + self.render_cpu
+            busy = self.sim_time + self.render_time - self.overlap_time
+            gain = max(0.0, serial - busy)
+            gain_pct = 100.0 * gain / serial if serial > 0 else 0.0
+            return "[render] cores={} frames={} dropped={} sim={:.2f}/{:.2f}ms render={:.2f}/{:.2f}ms (wall/cpu) gain={:.2f}ms ({:.0f}% of serial)".format(
+                os.cpu_count(), self.frames, self.dropped,
+                1000 * self.sim_time / n, 1000 * self.sim_cpu / n,
+                1000 * self.render_time / m, 1000 * self.render_cpu / m,
+                1000 * gain / n, gain_pct
+            )
+
+    def _check_error(self):
+        # 渲染线程已因异常退出时，在主线程重新抛出（调用方持锁）
+        if self._error is not None:
+            raise RuntimeError("渲染线程异常退出") from self._error
+
+    def _overlap(self, start, end):
+        # 计算模拟区间与渲染区间的交集（调用方持锁）
+        intervals = list(self._recent)
+        if self._busy_since is not None:
+            intervals.append((self._busy_since, end))
+        total = 0.0
+        for r_start, r_end in intervals:
+            total += max(0.0, min(end, r_end) - max(start, r_start))
+        return total
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                draw_list = self._pending
+                self._pending = None
+                self._busy_since = time.perf_counter()
+            cpu_start = time.thread_time()
+            error = None
+            try:
+                render_draw_list(self.screen, draw_list)
+                pygame.display.update()
+            except Exception as e:
+                error = e
+            cpu = time.thread_time() - cpu_start
+            with self._cond:
+                end = time.perf_counter()
+                self._recent.append((self._busy_since, end))
+                self.render_time += end - self._busy_since
+                self.render_cpu += cpu
+                self.frames += 1
+                self._busy_since = None
+                if error is not None:
+                    self._error = error
+                    self._running = False
+                self._cond.notify_all()
+                if error is not None:
+                    return
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import sys, os, random, pygame, math
+import sys, os, time, random, pygame, math
 from pygame.locals import *
 from MyLibrary import *
 
@@ -89,9 +89,9 @@ class MyMap:
         if self.x <= -self.width:
             self.x += self.width * 2
 
-    def draw(self, surface):
-        surface.blit(self.bg, (self.x, self.y))
-        surface.blit(self.bg, (self.x + self.width, self.y))
+    def draw_items(self):
+        return (draw_item(self.bg, (self.x, self.y)),
+                draw_item(self.bg, (self.x + self.width, self.y)))
 
 class Button:
     def __init__(self, up, down, pos):
@@ -185,7 +185,7 @@ class Fruit(MySprite):
         pass
 
 class Game:
-    def __init__(self):
+    def __init__(self, threaded_render=False):
         pygame.init()
         pygame.mixer.init()
         self.screen = pygame.display.set_mode((800,600))
@@ -260,6 +260,15 @@ class Game:
         self.reset_message_time = None
         self.last_reset_time = 0
 
+        self.player_alpha = 255
+        self.renderer = None
+        if threaded_render and sys.platform != "win32":
+            print("SDL 仅在 Windows 上支持从其他线程更新窗口，--threaded-render 不可用，已改为主线程渲染")
+            threaded_render = False
+        if threaded_render:
+            self.renderer = RenderThread(self.screen)
+            self.renderer.start()
+
     def get_current_config(self):
         return LEVEL_CONFIG[self.current_level]
 
@@ -285,10 +294,17 @@ class Game:
         self.group_exp.empty()
         self.fruit_group.empty()
         config = self.get_current_config()
+        if self.renderer is not None:
+            self.renderer.reset_stats()
         self.last_fruit_time = pygame.time.get_ticks()
         self.next_fruit_interval = random.randint(config["fruit_min"], config["fruit_max"])
         self.bg_music.play(loop=True)
 
+    def quit(self):
+        if self.renderer is not None:
+            self.renderer.stop()
+        pygame.quit(); sys.exit()
+
     def run(self):
         self.bg_music.play(loop=True)
         while True:
@@ -297,19 +313,29 @@ class Game:
 
             for e in events:
                 if e.type == QUIT:
-                    pygame.quit(); sys.exit()
+                    self.quit()
                 if e.type == KEYDOWN and e.key == K_ESCAPE:
                     if self.state in ["level_select", "level_complete", "gameover"]:
                         self.state = "menu"
                     else:
-                        pygame.quit(); sys.exit()
+                        self.quit()
+
+            if self.renderer is not None and self.state != "playing":
+                self.renderer.wait_idle()
 
             if self.state == "menu":
                 self.update_menu(events)
             elif self.state == "level_select":
                 self.update_level_select(events)
             elif self.state == "playing":
-                self.update_playing(events)
+                sim_start = time.perf_counter()
+                cpu_start = time.thread_time()
+                draw_list = self.update_playing(events)
+                if self.renderer is not None:
+                    self.renderer.submit(draw_list, sim_start, time.perf_counter(),
+                                         time.thread_time() - cpu_start)
+                    continue
+                render_draw_list(self.screen, draw_list)
             elif self.state == "gameover":
                 self.update_gameover(events)
             elif self.state == "level_complete":
@@ -373,11 +399,12 @@ class Game:
         if keys[K_SPACE] and not self.is_jumping:
             self.is_jumping = True
             self.jump_vel = -12.0
-            
+
+        draw = []
         self.bg1.move(config["ground_speed"])
         self.bg2.move(config["ground_speed"])
-        self.bg1.draw(self.screen)
-        self.bg2.draw(self.screen)
+        draw.extend(self.bg1.draw_items())
+        draw.extend(self.bg2.draw_items())
         
         if self.is_jumping:
             if self.jump_vel < 0: self.jump_vel += 0.6
@@ -393,9 +420,12 @@ class Game:
             
         current_time = pygame.time.get_ticks()
         self.group.update(current_time)
-        self.group.draw(self.screen)
+        for spr in self.group:
+            alpha = self.player_alpha if spr is self.player else None
+            draw.append(draw_item(spr.image, spr.rect.topleft, alpha))
         self.group_exp.update(current_time)
-        self.group_exp.draw(self.screen)
+        for exp in self.group_exp:
+            draw.append(draw_item(exp.image, exp.rect.topleft))
 
         if current_time - self.last_fruit_time > self.next_fruit_interval:
             fruit = Fruit()
@@ -406,7 +436,7 @@ class Game:
         for fruit in list(self.fruit_group):
             fruit.move(config["ground_speed"])
             fruit.update(current_time)
-            self.screen.blit(fruit.image, fruit.rect.topleft)
+            draw.append(draw_item(fruit.image, fruit.rect.topleft))
 
         hit_fruit = pygame.sprite.spritecollideany(self.player, self.fruit_group)
         if hit_fruit:
@@ -418,11 +448,11 @@ class Game:
         if self.invincible > 0:
             self.invincible -= self.clock.get_time()
             if int(current_time / 100) % 2 == 0:
-                self.player.image.set_alpha(100)
+                self.player_alpha = 100
             else:
-                self.player.image.set_alpha(255)
+                self.player_alpha = 255
         else:
-            self.player.image.set_alpha(255)
+            self.player_alpha = 255
 
         for exp in list(self.group_exp):
             if exp.frame >= exp.last_frame:
@@ -452,10 +482,11 @@ class Game:
         level_text = self.font.render(f"Level: {self.current_level}", True, (255,255,255))        
         lives_text = self.font.render(f"Lives: {self.lives}", True, (255,0,0))
 
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(best_text,  (10, 34))        
-        self.screen.blit(level_text, (680, 10))
-        self.screen.blit(lives_text, (680, 34))
+        draw.append(draw_item(score_text, (10, 10)))
+        draw.append(draw_item(best_text,  (10, 34)))
+        draw.append(draw_item(level_text, (680, 10)))
+        draw.append(draw_item(lives_text, (680, 34)))
+        return tuple(draw)
 
     def update_level_complete(self, events):
         self.screen.fill((30, 30, 30))
@@ -517,4 +548,4 @@ class Game:
                     save_progress(self.max_unlocked_level, self.best)
 
 if __name__ == "__main__":
-    Game().run()
\ No newline at end of file
+    Game(threaded_render="--threaded-render" in sys.argv).run()
\ No newline at end of file